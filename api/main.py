@@ -8,17 +8,53 @@ Implements:
 - Prometheus metrics integration
 """
 
-from fastapi import FastAPI, BackgroundTasks, Query, Response
-from fastapi.responses import HTMLResponse
-from prometheus_client import Counter, Histogram, Gauge, generate_latest
+from fastapi import FastAPI, BackgroundTasks, Query, Request, Response
+from fastapi.responses import PlainTextResponse, ORJSONResponse, RedirectResponse
+from starlette.middleware.gzip import GZipMiddleware
+from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from pathlib import Path
 import asyncio
+import gzip
+import hashlib
+import math
+import os
+import re
 import threading
 import time
 import numpy as np
-from typing import List
+import psutil
+from typing import Callable, Deque, List, Optional, Tuple
 import logging
 
+# Numba threading layer untuk prange kernel
+# OpenMP is thread-safe and, unlike TBB, shuts down cleanly when the kernel
+# was launched from a worker thread (libgomp ships with gcc in the image)
+os.environ.setdefault("NUMBA_THREADING_LAYER", "omp")
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Fallback ke NumPy vectorized path
+    NUMBA_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:  # Dashboard tetap dikirim gzip / raw
+    BROTLI_AVAILABLE = False
+
+try:
+    import csscompressor
+    import rjsmin
+    MINIFIERS_AVAILABLE = True
+except ImportError:  # Fallback: hanya indentasi dan baris kosong yang dibuang
+    MINIFIERS_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,62 +63,192 @@ logger = logging.getLogger(__name__)
 # PROMETHEUS METRICS
 # ============================================
 REQUEST_COUNT = Counter('api_requests_total', 'Total API requests', ['endpoint', 'method'])
-REQUEST_DURATION = Histogram('api_request_duration_seconds', 'Request duration', ['endpoint'])
+# Bucket disesuaikan dengan rentang durasi endpoint (5ms - 5s)
+REQUEST_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+REQUEST_DURATION = Histogram(
+    'api_request_duration_seconds', 'Request duration', ['endpoint'],
+    buckets=REQUEST_DURATION_BUCKETS
+)
 ACTIVE_THREADS = Gauge('api_active_threads', 'Number of active threads')
 CPU_INTENSIVE_OPS = Counter('api_cpu_operations_total', 'CPU intensive operations completed')
 ERRORS = Counter('api_errors_total', 'Total errors', ['type'])
 
+# Labeled children di-bind sekali, bukan lookup .labels() tiap request
+SINGLE_REQUESTS = REQUEST_COUNT.labels(endpoint='/process-single', method='GET')
+SINGLE_DURATION = REQUEST_DURATION.labels(endpoint='/process-single')
+PARALLEL_REQUESTS = REQUEST_COUNT.labels(endpoint='/process-parallel', method='GET')
+PARALLEL_DURATION = REQUEST_DURATION.labels(endpoint='/process-parallel')
+ASYNC_REQUESTS = REQUEST_COUNT.labels(endpoint='/process-async', method='GET')
+ASYNC_DURATION = REQUEST_DURATION.labels(endpoint='/process-async')
+
 # ============================================
 # SYNCHRONIZATION PRIMITIVES
 # ============================================
-# Mutex untuk shared resource
-data_lock = threading.Lock()
-shared_counter = 0
+# Counter tanpa lock: next() pada itertools.count atomic (C-level, di bawah GIL),
+# dipakai sebagai nomor urut per task. Nilai shared_counter yang ditampilkan
+# dihitung saat dibaca dari shared_store (satu entry per task selesai), jadi
+# tidak ada publish yang bisa saling menimpa.
+_counter = count(1)
 
-# Semaphore untuk limit concurrent operations
+# Thread pool dipakai ulang antar request, ukuran pool membatasi concurrent operations.
+# Dibuat dan di-shutdown oleh lifespan (app.state.executor), supaya lifespan
+# berikutnya di proses yang sama tidak memakai pool yang sudah mati
 max_concurrent_operations = 5
-operation_semaphore = threading.Semaphore(max_concurrent_operations)
+
+# ============================================
+# RESULT TYPES
+# ============================================
+# Slotted dataclass: lebih kecil dan lebih cepat dibuat daripada dict per task,
+# dan diserialisasi langsung oleh orjson
+@dataclass(slots=True)
+class TaskResult:
+    """Result row for a single processed task"""
+    task_id: int
+    result: float
+    processed_by: str
+
+@dataclass(slots=True)
+class ThreadedTaskResult(TaskResult):
+    """Version B result row, includes the shared counter snapshot"""
+    counter_value: int
+
+@dataclass(slots=True)
+class StoreEntry:
+    """Entry recorded in SharedDataStore by Version B workers"""
+    task_id: int
+    thread: str
+    timestamp: float
 
 # ============================================
 # SHARED RESOURCE MANAGEMENT
 # ============================================
 class SharedDataStore:
-    """Thread-safe data store dengan mutex"""
-    def __init__(self):
-        self.data: List[dict] = []
-        self.lock = threading.Lock()
-        self.operation_count = 0
+    """Thread-safe data store dengan striped locking (satu mutex per shard)"""
+    def __init__(self, stripes: int = 8):
+        self._shards: List[Tuple[threading.Lock, Deque[StoreEntry]]] = [
+            (threading.Lock(), deque()) for _ in range(stripes)
+        ]
+        # Tiap thread dapat shard sendiri secara round-robin saat pertama kali menulis
+        self._stripe_counter = count()
+        self._local = threading.local()
+    
+    def _shard(self) -> Tuple[threading.Lock, Deque[StoreEntry]]:
+        """Shard assigned to the calling thread"""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._shards[next(self._stripe_counter) % len(self._shards)]
+            self._local.shard = shard
+        return shard
     
-    def add_data(self, item: dict):
+    def add_data(self, item: StoreEntry):
         """Thread-safe data addition"""
-        with self.lock:  # Mutex lock
-            self.data.append(item)
-            self.operation_count += 1
-            logger.info(f"Data added. Total items: {len(self.data)}")
+        lock, shard = self._shard()
+        with lock:  # Mutex per shard, hanya thread di stripe yang sama yang bersaing
+            shard.append(item)
+        if logger.isEnabledFor(logging.INFO):  # Skip formatting when filtered
+            logger.info("Data added. Total items: %d", self.total_items())
+    
+    def total_items(self) -> int:
+        """Entries across all shards"""
+        # len(deque) atomic dan shard hanya bertambah, jadi hasilnya tidak mundur
+        return sum(len(shard) for _, shard in self._shards)
     
     def get_stats(self):
         """Thread-safe stats retrieval"""
-        with self.lock:
-            return {
-                "total_items": len(self.data),
-                "operations": self.operation_count
-            }
+        # Snapshot tanpa lock; satu append per operasi, jadi operations
+        # dihitung saat dibaca dari jumlah entry
+        total = self.total_items()
+        return {
+            "total_items": total,
+            "operations": total
+        }
 
 # Global shared store
-shared_store = SharedDataStore()
+shared_store = SharedDataStore(stripes=max_concurrent_operations)
 
 # ============================================
 # CPU INTENSIVE SIMULATION
 # ============================================
-def cpu_intensive_task(n: int = 1000000) -> float:
+# Cache (arange, sqrt(arange)) per n (read-only, aman dibagi antar thread)
+# sqrt(i) sama untuk setiap request, jadi cukup dihitung sekali
+# float32: ini simulasi beban CPU, bukan perhitungan yang butuh presisi,
+# jadi setengah memory bandwidth dan dua kali lebar SIMD lebih berguna
+_SCRATCH_DTYPE = np.float32
+_SCRATCH: dict = {}
+# Scratch buffer per thread supaya worker tidak saling menimpa
+_scratch_local = threading.local()
+
+def _get_buffers(n: int):
+    """Return cached (arange, sqrt_arange, scratch) buffers for size n"""
+    cached = _SCRATCH.get(n)
+    if cached is None:
+        x = np.arange(n, dtype=_SCRATCH_DTYPE)
+        sqrt_x = np.sqrt(x)
+        x.flags.writeable = False
+        sqrt_x.flags.writeable = False
+        cached = _SCRATCH.setdefault(n, (x, sqrt_x))
+    x, sqrt_x = cached
+    buf = getattr(_scratch_local, "buf", None)
+    if buf is None or buf.shape[0] != n:
+        buf = np.empty_like(x)
+        _scratch_local.buf = buf
+    return x, sqrt_x, buf
+
+def _cpu_kernel_numpy(n: int) -> float:
+    """
+    Vectorized: sum(sqrt(i) * sin(i)) for i in [0, n) via NumPy ufuncs
+    The ufunc inner loops run without the GIL, so worker threads overlap here too
+    """
+    x, sqrt_x, buf = _get_buffers(n)
+    np.sin(x, out=buf)
+    buf *= sqrt_x
+    # Accumulator float64 supaya hasil tidak drift terlalu jauh dari kernel numba
+    return float(buf.sum(dtype=np.float64))
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, nogil=True, boundscheck=False)
+    def _cpu_kernel(n):
+        """JIT-compiled loop, releases the GIL so worker threads run in parallel"""
+        r = 0.0
+        for i in range(n):
+            fi = float(i)
+            r += math.sqrt(fi) * math.sin(fi)
+        return r
+
+    @njit(parallel=True, fastmath=True, nogil=True, cache=True)
+    def _cpu_kernel_par(n):
+        """Same reduction split across cores with prange"""
+        r = 0.0
+        for i in prange(n):
+            fi = float(i)
+            r += math.sqrt(fi) * math.sin(fi)
+        return r
+else:
+    _cpu_kernel = _cpu_kernel_numpy
+    _cpu_kernel_par = _cpu_kernel_numpy
+
+def cpu_intensive_task(n: int = 1000000, parallel: bool = False) -> float:
     """
     Simulate CPU-intensive work
     Represents database query, complex calculation, etc.
+
+    parallel=True uses the prange kernel; only for callers that have no
+    thread-level parallelism of their own (Version A with parallel_cpu=true)
+
+    Sengaja tidak di-cache (lru_cache): hasilnya memang deterministik per n,
+    tapi tujuan fungsi ini adalah membebani CPU supaya model concurrency
+    bisa dibandingkan. Kernel JIT sudah membuat beban itu murah.
     """
-    result = 0
-    for i in range(n):
-        result += np.sqrt(i) * np.sin(i)
-    return result
+    kernel = _cpu_kernel_par if parallel else _cpu_kernel
+    return float(kernel(n))
+
+def warm_up_kernels():
+    """
+    Compile (or load from the numba cache) both CPU kernels
+    Also run at image build time so the compiled cache ships in the image
+    """
+    _cpu_kernel(1)
+    _cpu_kernel_par(1)
 
 def io_simulation(duration: float = 0.1):
     """Simulate I/O wait (database, network, etc.)"""
@@ -96,587 +262,398 @@ async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
     logger.info("🚀 API Server Starting...")
     logger.info(f"Max concurrent operations: {max_concurrent_operations}")
+    # Pre-warm JIT supaya request pertama tidak menanggung compile cost
+    warm_up_kernels()
+    # Prime psutil supaya cpu_percent(interval=None) punya baseline
+    psutil.cpu_percent(interval=None)
+    logger.info(f"CPU kernel: {'numba' if NUMBA_AVAILABLE else 'numpy'}")
+    executor = ThreadPoolExecutor(
+        max_workers=max_concurrent_operations,
+        thread_name_prefix="worker"
+    )
+    app.state.executor = executor
     yield
     logger.info("🛑 API Server Shutting Down...")
+    executor.shutdown(wait=True)
 
 app = FastAPI(
     title="Concurrent Web Service",
     description="Performance analysis of single vs multi-threaded implementations",
     version="2.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Kompres response JSON; response yang sudah punya Content-Encoding (dashboard) dilewati
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
 # ============================================
 # VERSION A: SINGLE-THREADED BASELINE
 # ============================================
 @app.get("/api/v1/process-single")
-async def process_single(items: int = Query(default=5, ge=1, le=20)):
+def process_single(
+    items: int = Query(default=5, ge=1, le=20),
+    parallel_cpu: bool = Query(default=False)
+):
     """
     VERSION A: Single-threaded sequential processing
     
     Characteristics:
     - Processes requests one by one
-    - No parallelism
+    - No parallelism (default), so it stays a fair baseline for Version B
     - Predictable but slow for multiple operations
+    
+    parallel_cpu=true runs the CPU phase of each item on all cores with the
+    prange kernel; items are still processed sequentially
+    
+    Declared as plain def: FastAPI runs it in its threadpool, so the
+    blocking io_simulation does not stall the event loop
     """
-    start_time = time.time()
-    REQUEST_COUNT.labels(endpoint='/process-single', method='GET').inc()
+    start_time = time.perf_counter()
+    SINGLE_REQUESTS.inc()
     
     results = []
+    cpu_ops_inc = CPU_INTENSIVE_OPS.inc
     
     # Sequential processing
     for i in range(items):
         # Simulate work
-        cpu_result = cpu_intensive_task(500000)
+        cpu_result = cpu_intensive_task(500000, parallel=parallel_cpu)
         io_simulation(0.05)
         
-        results.append({
-            "task_id": i,
-            "result": round(cpu_result, 2),
-            "processed_by": "single_thread"
-        })
+        results.append(TaskResult(i, round(cpu_result, 2), "single_thread"))
         
-        CPU_INTENSIVE_OPS.inc()
+        cpu_ops_inc()
     
-    duration = time.time() - start_time
-    REQUEST_DURATION.labels(endpoint='/process-single').observe(duration)
+    duration = time.perf_counter() - start_time
+    SINGLE_DURATION.observe(duration)
     
-    return {
+    # Langsung ke ORJSONResponse: orjson serialize dataclass tanpa jsonable_encoder
+    return ORJSONResponse({
         "version": "A - Single Threaded",
         "items_processed": items,
         "duration_seconds": round(duration, 3),
         "results": results,
-        "concurrency": "none"
-    }
+        "concurrency": "core-parallel cpu" if parallel_cpu else "none"
+    })
 
 # ============================================
 # VERSION B: MULTI-THREADED WITH SYNC
 # ============================================
-def process_task_threaded(task_id: int) -> dict:
+def process_task_threaded(task_id: int) -> ThreadedTaskResult:
     """
     Worker function for thread pool
-    Uses semaphore to limit concurrent operations
+    Concurrency is bounded by the app.state.executor pool size
     """
-    with operation_semaphore:  # Semaphore: limit concurrent access
-        ACTIVE_THREADS.inc()
+    ACTIVE_THREADS.inc()
+    
+    try:
+        # Simulate work
+        cpu_result = cpu_intensive_task(500000)
+        io_simulation(0.05)
         
-        try:
-            # Simulate work
-            cpu_result = cpu_intensive_task(500000)
-            io_simulation(0.05)
-            
-            # Thread-safe counter increment
-            global shared_counter
-            with data_lock:  # Mutex: protect shared resource
-                shared_counter += 1
-                current_count = shared_counter
-            
-            # Add to shared store
-            shared_store.add_data({
-                "task_id": task_id,
-                "thread": threading.current_thread().name,
-                "timestamp": time.time()
-            })
-            
-            CPU_INTENSIVE_OPS.inc()
-            
-            return {
-                "task_id": task_id,
-                "result": round(cpu_result, 2),
-                "processed_by": threading.current_thread().name,
-                "counter_value": current_count
-            }
-        finally:
-            ACTIVE_THREADS.dec()
+        # Thread-safe counter increment
+        current_count = next(_counter)  # Atomic, no mutex needed
+        
+        # Add to shared store
+        thread_name = threading.current_thread().name
+        shared_store.add_data(StoreEntry(task_id, thread_name, time.time()))
+        
+        CPU_INTENSIVE_OPS.inc()
+        
+        return ThreadedTaskResult(
+            task_id, round(cpu_result, 2), thread_name, current_count
+        )
+    finally:
+        ACTIVE_THREADS.dec()
 
 @app.get("/api/v1/process-parallel")
-async def process_parallel(items: int = Query(default=5, ge=1, le=20)):
+async def process_parallel(request: Request, items: int = Query(default=5, ge=1, le=20)):
     """
     VERSION B: Multi-threaded parallel processing
     
     Characteristics:
-    - Uses ThreadPoolExecutor for parallel execution
-    - Semaphore limits max concurrent threads
-    - Mutex protects shared counter
+    - Uses a shared ThreadPoolExecutor for parallel execution
+    - Pool size limits max concurrent threads
+    - Atomic counter for the shared task count
     - Better throughput for I/O and CPU bound tasks
     """
-    start_time = time.time()
-    REQUEST_COUNT.labels(endpoint='/process-parallel', method='GET').inc()
+    start_time = time.perf_counter()
+    PARALLEL_REQUESTS.inc()
     
-    # Create thread pool
-    threads = []
-    results = []
-    
-    # Launch threads
-    for i in range(items):
-        thread = threading.Thread(
-            target=lambda tid: results.append(process_task_threaded(tid)),
-            args=(i,)
-        )
-        threads.append(thread)
-        thread.start()
-    
-    # Wait for all threads
-    for thread in threads:
-        thread.join()
+    # Submit tasks to the pool without blocking the event loop
+    executor = request.app.state.executor
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(*[
+        loop.run_in_executor(executor, process_task_threaded, i)
+        for i in range(items)
+    ])
     
-    duration = time.time() - start_time
-    REQUEST_DURATION.labels(endpoint='/process-parallel').observe(duration)
+    duration = time.perf_counter() - start_time
+    PARALLEL_DURATION.observe(duration)
     
-    return {
+    return ORJSONResponse({
         "version": "B - Multi-threaded",
         "items_processed": items,
         "duration_seconds": round(duration, 3),
         "results": results,
         "concurrency": "parallel",
         "max_concurrent_threads": max_concurrent_operations,
-        "shared_counter": shared_counter,
+        "shared_counter": shared_store.total_items(),
         "store_stats": shared_store.get_stats()
-    }
+    })
 
 # ============================================
 # ASYNC ENDPOINTS (Non-blocking I/O)
 # ============================================
 @app.get("/api/v1/process-async")
-async def process_async(items: int = Query(default=5, ge=1, le=20)):
+async def process_async(request: Request, items: int = Query(default=5, ge=1, le=20)):
     """
     Async/await implementation
     Best for I/O-bound operations
     """
-    start_time = time.time()
-    REQUEST_COUNT.labels(endpoint='/process-async', method='GET').inc()
+    start_time = time.perf_counter()
+    ASYNC_REQUESTS.inc()
+    
+    executor = request.app.state.executor
+    loop = asyncio.get_running_loop()
     
     async def async_task(task_id: int):
         """Async worker"""
         await asyncio.sleep(0.05)  # Simulate async I/O
-        cpu_result = cpu_intensive_task(500000)
+        # CPU work di thread pool supaya event loop tidak ter-block
+        cpu_result = await loop.run_in_executor(executor, cpu_intensive_task, 500000)
         CPU_INTENSIVE_OPS.inc()
         
-        return {
-            "task_id": task_id,
-            "result": round(cpu_result, 2),
-            "processed_by": "async_coroutine"
-        }
+        return TaskResult(task_id, round(cpu_result, 2), "async_coroutine")
     
     # Run all tasks concurrently
     tasks = [async_task(i) for i in range(items)]
     results = await asyncio.gather(*tasks)
     
-    duration = time.time() - start_time
-    REQUEST_DURATION.labels(endpoint='/process-async').observe(duration)
+    duration = time.perf_counter() - start_time
+    ASYNC_DURATION.observe(duration)
     
-    return {
+    return ORJSONResponse({
         "version": "Async/Await",
         "items_processed": items,
         "duration_seconds": round(duration, 3),
         "results": results,
         "concurrency": "async"
-    }
+    })
 
 # ============================================
 # SYSTEM INFO & MONITORING
 # ============================================
+# Cache pembacaan psutil, diperbarui paling sering sekali per TTL
+SYSTEM_INFO_CACHE_TTL = 1.0
+_system_cache = {"t": 0.0, "cpu_percent": 0.0, "memory_percent": 0.0}
+_system_lock = threading.Lock()
+# Handle proses dibuat sekali, bukan psutil.Process() per request
+_process = psutil.Process()
+_cpu_count = os.cpu_count()
+
 @app.get("/api/v1/system-info")
 async def system_info():
     """Get current system state"""
-    import psutil
-    import os
+    now = time.monotonic()
+    if now - _system_cache["t"] > SYSTEM_INFO_CACHE_TTL:
+        with _system_lock:
+            if now - _system_cache["t"] > SYSTEM_INFO_CACHE_TTL:
+                # interval=None: non-blocking, usage since the previous call
+                _system_cache["cpu_percent"] = psutil.cpu_percent(interval=None)
+                _system_cache["memory_percent"] = _process.memory_percent()
+                _system_cache["t"] = now
     
     return {
-        "cpu_count": os.cpu_count(),
-        "cpu_percent": psutil.cpu_percent(interval=0.1),
-        "memory_percent": psutil.Process().memory_percent(),
+        "cpu_count": _cpu_count,
+        "cpu_percent": _system_cache["cpu_percent"],
+        "memory_percent": _system_cache["memory_percent"],
         "active_threads": threading.active_count(),
-        "shared_counter": shared_counter,
+        "shared_counter": shared_store.total_items(),
         "store_stats": shared_store.get_stats()
     }
 
+# Cache hasil serialisasi /metrics supaya scrape beruntun tidak generate ulang
+METRICS_CACHE_TTL = 1.0
+_metrics_cache = {"t": 0.0, "body": b""}
+_metrics_lock = threading.Lock()
+
 @app.get("/metrics")
 async def metrics():
     """Prometheus metrics endpoint"""
-    data = generate_latest()
+    now = time.monotonic()
+    if now - _metrics_cache["t"] > METRICS_CACHE_TTL:
+        with _metrics_lock:  # Double-checked: only one caller regenerates
+            if now - _metrics_cache["t"] > METRICS_CACHE_TTL:
+                _metrics_cache["body"] = generate_latest()
+                _metrics_cache["t"] = now
     return Response(
-        content=data,
-        media_type="text/plain; version=0.0.4; charset=utf-8"
+        content=_metrics_cache["body"],
+        media_type=CONTENT_TYPE_LATEST
     )
 
 
 # ============================================
 # UI DASHBOARD
 # ============================================
-@app.get("/", response_class=HTMLResponse)
-async def dashboard():
-    """Apple-inspired minimalist dashboard"""
-    return """
+# CSS dan JS dashboard disajikan terpisah supaya bisa di-cache browser;
+# di-minify dan dikompres sekali saat import, lalu disajikan dari memory
+STATIC_DIR = Path(__file__).parent / "static"
+_IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of each If-None-Match entry against etag (RFC 9110 13.1.2)"""
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+@dataclass(slots=True)
+class EncodedResponses:
+    """Prebuilt responses for one constant body, one per content-encoding"""
+    etag: str
+    identity: Response
+    gzip: Response
+    br: Optional[Response]
+    not_modified: Response
+    
+    def select(self, request: Request) -> Response:
+        """304 if the client already has this body, else the best accepted encoding"""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, self.etag):
+            return self.not_modified
+        accept_encoding = request.headers.get("accept-encoding", "")
+        if self.br is not None and "br" in accept_encoding:
+            return self.br
+        # Cek "gzip" ini harus sama dengan GZipMiddleware. Middleware mengubah
+        # raw_headers response in-place saat mengompres; identity (shared object)
+        # aman hanya karena tidak pernah dikirim ke client yang menerima gzip.
+        # Varian br/gzip sudah punya Content-Encoding, jadi dilewati middleware.
+        if "gzip" in accept_encoding:
+            return self.gzip
+        return self.identity
+
+def _encode_responses(body: bytes, media_type: str, headers: dict) -> EncodedResponses:
+    """Compress body once and build every response variant up front"""
+    # Weak ETag: identity, gzip dan br berbeda byte-nya, tapi isinya sama
+    etag = 'W/"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+    headers = {"vary": "Accept-Encoding", "etag": etag, **headers}
+    br = None
+    if BROTLI_AVAILABLE:
+        br = Response(
+            brotli.compress(body), media_type=media_type,
+            headers={**headers, "content-encoding": "br"}
+        )
+    return EncodedResponses(
+        etag=etag,
+        identity=Response(body, media_type=media_type, headers=headers),
+        # mtime=0: header gzip tanpa timestamp, jadi byte-nya sama di setiap worker
+        gzip=Response(
+            gzip.compress(body, compresslevel=9, mtime=0), media_type=media_type,
+            headers={**headers, "content-encoding": "gzip"}
+        ),
+        br=br,
+        not_modified=Response(status_code=304, headers=headers)
+    )
+
+def _strip_lines(text: str) -> str:
+    """
+    Drop indentation and blank lines, nothing else
+    Does not parse the syntax, so only safe without multi-line string literals
+    """
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+# Regex tidak paham string/selector CSS dan JS, jadi komentar dan whitespace
+# di tengah baris hanya dibuang oleh minifier sungguhan
+def _minify_css(css: str) -> str:
+    """Minify CSS with csscompressor, or only strip indentation without it"""
+    return csscompressor.compress(css) if MINIFIERS_AVAILABLE else _strip_lines(css)
+
+def _minify_js(js: str) -> str:
+    """Minify JS with rjsmin, or only strip indentation without it"""
+    return rjsmin.jsmin(js) if MINIFIERS_AVAILABLE else _strip_lines(js)
+
+@dataclass(slots=True)
+class StaticAsset:
+    """Minified dashboard asset held in memory"""
+    version: str
+    url: str
+    versioned: EncodedResponses    # ?v=<version>: immutable
+    unversioned: EncodedResponses  # URL lain: revalidasi lewat ETag
+
+def _load_asset(name: str, minify: Callable[[str], str], media_type: str) -> StaticAsset:
+    """Read, minify and pre-compress a file from STATIC_DIR"""
+    body = minify((STATIC_DIR / name).read_text(encoding="utf-8")).encode("utf-8")
+    version = hashlib.sha1(body).hexdigest()[:12]
+    return StaticAsset(
+        version=version,
+        url=f"/static/{name}?v={version}",
+        versioned=_encode_responses(body, media_type, {"cache-control": _IMMUTABLE_CACHE}),
+        unversioned=_encode_responses(body, media_type, {"cache-control": "no-cache"})
+    )
+
+_STATIC_ASSETS = {
+    "dashboard.css": _load_asset("dashboard.css", _minify_css, "text/css"),
+    "dashboard.js": _load_asset("dashboard.js", _minify_js, "text/javascript")
+}
+_STATIC_NOT_FOUND = PlainTextResponse("Not Found", status_code=404)
+
+async def static_asset(request: Request) -> Response:
+    """Serve a minified dashboard asset from memory"""
+    asset = _STATIC_ASSETS.get(request.path_params["name"])
+    if asset is None:
+        return _STATIC_NOT_FOUND
+    # Hanya hash yang cocok dengan isi sekarang yang immutable; ?v=lama tidak
+    # boleh mem-pin konten baru di URL lama
+    if request.query_params.get("v") == asset.version:
+        return asset.versioned.select(request)
+    return asset.unversioned.select(request)
+
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+
+def _minify_html(html: str) -> str:
+    """
+    Lightweight minifier for the dashboard shell
+    Strips comments, indentation and blank lines
+    """
+    return _strip_lines(_HTML_COMMENT_RE.sub("", html))
+
+# Apple-inspired minimalist dashboard, di-encode sekali saat import
+_DASHBOARD_HTML: str = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Concurrent Web Service</title>
-        <style>
-            * {
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }
-            
-            body {
-                font-family: -apple-system, BlinkMacSystemFont, 'SF Pro Display', 'Segoe UI', sans-serif;
-                background: #f5f5f7;
-                min-height: 100vh;
-                color: #1d1d1f;
-                line-height: 1.47059;
-                font-weight: 400;
-                letter-spacing: -.022em;
-            }
-            
-            /* Navigation Bar */
-            nav {
-                background: rgba(255, 255, 255, 0.8);
-                backdrop-filter: saturate(180%) blur(20px);
-                border-bottom: 1px solid rgba(0, 0, 0, 0.1);
-                position: sticky;
-                top: 0;
-                z-index: 1000;
-            }
-            
-            .nav-content {
-                max-width: 1400px;
-                margin: 0 auto;
-                padding: 16px 40px;
-                display: flex;
-                justify-content: space-between;
-                align-items: center;
-            }
-            
-            .logo {
-                font-size: 21px;
-                font-weight: 600;
-                color: #1d1d1f;
-                letter-spacing: -0.5px;
-            }
-            
-            .nav-links {
-                display: flex;
-                gap: 32px;
-                align-items: center;
-            }
-            
-            .nav-links a {
-                color: #1d1d1f;
-                text-decoration: none;
-                font-size: 14px;
-                transition: opacity 0.3s;
-            }
-            
-            .nav-links a:hover {
-                opacity: 0.6;
-            }
-            
-            /* Hero Section */
-            .hero {
-                max-width: 1400px;
-                margin: 0 auto;
-                padding: 80px 40px 60px;
-                text-align: center;
-            }
-            
-            h1 {
-                font-size: 56px;
-                line-height: 1.07143;
-                font-weight: 600;
-                letter-spacing: -.005em;
-                margin-bottom: 12px;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                -webkit-background-clip: text;
-                -webkit-text-fill-color: transparent;
-                background-clip: text;
-            }
-            
-            .subtitle {
-                font-size: 21px;
-                line-height: 1.381;
-                font-weight: 400;
-                color: #6e6e73;
-                margin-bottom: 24px;
-            }
-            
-            .description {
-                font-size: 17px;
-                line-height: 1.47059;
-                font-weight: 400;
-                color: #86868b;
-                max-width: 800px;
-                margin: 0 auto 48px;
-            }
-            
-            /* Test Cards Grid */
-            .container {
-                max-width: 1400px;
-                margin: 0 auto;
-                padding: 0 40px 80px;
-            }
-            
-            .grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-                gap: 24px;
-            }
-            
-            .card {
-                background: #fff;
-                border-radius: 18px;
-                padding: 40px;
-                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.07);
-                transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-                position: relative;
-                overflow: hidden;
-            }
-            
-            .card::before {
-                content: '';
-                position: absolute;
-                top: 0;
-                left: 0;
-                right: 0;
-                height: 4px;
-                background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-                opacity: 0;
-                transition: opacity 0.3s;
-            }
-            
-            .card:hover {
-                transform: translateY(-4px);
-                box-shadow: 0 12px 24px rgba(0, 0, 0, 0.12);
-            }
-            
-            .card:hover::before {
-                opacity: 1;
-            }
-            
-            .card-icon {
-                font-size: 48px;
-                margin-bottom: 16px;
-                display: block;
-            }
-            
-            .card h2 {
-                font-size: 28px;
-                line-height: 1.14286;
-                font-weight: 600;
-                letter-spacing: .007em;
-                margin-bottom: 8px;
-                color: #1d1d1f;
-            }
-            
-            .card-subtitle {
-                font-size: 14px;
-                color: #86868b;
-                margin-bottom: 20px;
-                text-transform: uppercase;
-                letter-spacing: 0.05em;
-                font-weight: 500;
-            }
-            
-            .card-description {
-                font-size: 17px;
-                line-height: 1.47059;
-                color: #6e6e73;
-                margin-bottom: 24px;
-            }
-            
-            .specs {
-                list-style: none;
-                margin-bottom: 32px;
-                padding: 0;
-            }
-            
-            .specs li {
-                font-size: 14px;
-                color: #6e6e73;
-                padding: 8px 0;
-                border-bottom: 1px solid #f5f5f7;
-                display: flex;
-                justify-content: space-between;
-            }
-            
-            .specs li:last-child {
-                border-bottom: none;
-            }
-            
-            .spec-label {
-                color: #86868b;
-            }
-            
-            .spec-value {
-                font-weight: 500;
-                color: #1d1d1f;
-            }
-            
-            /* Buttons */
-            .btn {
-                width: 100%;
-                padding: 14px 20px;
-                border: none;
-                border-radius: 980px;
-                font-size: 17px;
-                font-weight: 400;
-                cursor: pointer;
-                transition: all 0.3s;
-                text-decoration: none;
-                display: inline-block;
-                text-align: center;
-                letter-spacing: -.022em;
-            }
-            
-            .btn-primary {
-                background: #0071e3;
-                color: #fff;
-            }
-            
-            .btn-primary:hover {
-                background: #0077ed;
-            }
-            
-            .btn-secondary {
-                background: #1d1d1f;
-                color: #fff;
-            }
-            
-            .btn-secondary:hover {
-                background: #424245;
-            }
-            
-            /* Results */
-            .result-box {
-                margin-top: 24px;
-                padding: 20px;
-                background: #f5f5f7;
-                border-radius: 12px;
-                display: none;
-                animation: fadeIn 0.3s ease-in;
-            }
-            
-            .result-box.show {
-                display: block;
-            }
-            
-            @keyframes fadeIn {
-                from { opacity: 0; transform: translateY(-10px); }
-                to { opacity: 1; transform: translateY(0); }
-            }
-            
-            .result-title {
-                font-size: 19px;
-                font-weight: 600;
-                margin-bottom: 16px;
-                color: #1d1d1f;
-            }
-            
-            .metric-row {
-                display: flex;
-                justify-content: space-between;
-                padding: 12px 0;
-                border-bottom: 1px solid #e5e5e7;
-            }
-            
-            .metric-row:last-child {
-                border-bottom: none;
-            }
-            
-            .metric-label {
-                font-size: 14px;
-                color: #86868b;
-            }
-            
-            .metric-value {
-                font-size: 17px;
-                font-weight: 600;
-                color: #0071e3;
-            }
-            
-            /* Loading Spinner */
-            .loading-spinner {
-                display: inline-block;
-                width: 20px;
-                height: 20px;
-                border: 2px solid #e5e5e7;
-                border-top: 2px solid #0071e3;
-                border-radius: 50%;
-                animation: spin 1s linear infinite;
-            }
-            
-            @keyframes spin {
-                0% { transform: rotate(0deg); }
-                100% { transform: rotate(360deg); }
-            }
-            
-            /* Footer */
-            footer {
-                background: #f5f5f7;
-                padding: 40px;
-                text-align: center;
-                border-top: 1px solid #d2d2d7;
-                margin-top: 60px;
-            }
-            
-            footer p {
-                font-size: 12px;
-                color: #86868b;
-                margin: 8px 0;
-            }
-            
-            /* Responsive */
-            @media (max-width: 768px) {
-                h1 {
-                    font-size: 40px;
-                }
-                
-                .subtitle {
-                    font-size: 19px;
-                }
-                
-                .nav-content {
-                    padding: 12px 20px;
-                }
-                
-                .hero {
-                    padding: 40px 20px 30px;
-                }
-                
-                .container {
-                    padding: 0 20px 40px;
-                }
-                
-                .grid {
-                    grid-template-columns: 1fr;
-                }
-                
-                .card {
-                    padding: 30px;
-                }
-                
-                .nav-links {
-                    gap: 16px;
-                }
-                
-                .nav-links a {
-                    font-size: 12px;
-                }
-            }
-        </style>
+        <link rel="preconnect" href="http://localhost:9090">
+        <link rel="preconnect" href="http://localhost:3000">
+        <link rel="dns-prefetch" href="//localhost:9090">
+        <link rel="dns-prefetch" href="//localhost:3000">
+        <link rel="stylesheet" href="{css_url}">
+        <script src="{js_url}" defer></script>
     </head>
     <body>
+        <!-- Card icons (inline SVG sprite) -->
+        <svg xmlns="http://www.w3.org/2000/svg" style="display: none">
+            <symbol id="ico-bolt" viewBox="0 0 24 24"><path d="M13 2 3 14h9l-1 8 10-12h-9l1-8z"/></symbol>
+            <symbol id="ico-rocket" viewBox="0 0 24 24"><path d="M4.5 16.5c-1.5 1.3-2 5-2 5s3.7-.5 5-2c.7-.8.7-2.1-.1-2.9a2.2 2.2 0 0 0-2.9-.1z"/><path d="m12 15-3-3a22 22 0 0 1 2-3.9A12.9 12.9 0 0 1 22 2c0 2.7-.8 7.5-6 11a22.4 22.4 0 0 1-4 2z"/><path d="M9 12H4s.6-3 2-4c1.6-1.1 5 0 5 0"/><path d="M12 15v5s3-.6 4-2c1.1-1.6 0-5 0-5"/></symbol>
+            <symbol id="ico-gear" viewBox="0 0 24 24"><circle cx="12" cy="12" r="3"/><path d="M19.4 15a1.7 1.7 0 0 0 .3 1.8l.1.1a2 2 0 1 1-2.8 2.8l-.1-.1a1.7 1.7 0 0 0-1.8-.3 1.7 1.7 0 0 0-1 1.5V21a2 2 0 1 1-4 0v-.1a1.7 1.7 0 0 0-1.1-1.5 1.7 1.7 0 0 0-1.8.3l-.1.1a2 2 0 1 1-2.8-2.8l.1-.1a1.7 1.7 0 0 0 .3-1.8 1.7 1.7 0 0 0-1.5-1H3a2 2 0 1 1 0-4h.1a1.7 1.7 0 0 0 1.5-1.1 1.7 1.7 0 0 0-.3-1.8l-.1-.1a2 2 0 1 1 2.8-2.8l.1.1a1.7 1.7 0 0 0 1.8.3H9a1.7 1.7 0 0 0 1-1.5V3a2 2 0 1 1 4 0v.1a1.7 1.7 0 0 0 1 1.5 1.7 1.7 0 0 0 1.8-.3l.1-.1a2 2 0 1 1 2.8 2.8l-.1.1a1.7 1.7 0 0 0-.3 1.8V9a1.7 1.7 0 0 0 1.5 1H21a2 2 0 1 1 0 4h-.1a1.7 1.7 0 0 0-1.5 1z"/></symbol>
+            <symbol id="ico-chart" viewBox="0 0 24 24"><path d="M3 3v18h18"/><path d="M18 17V9"/><path d="M13 17V5"/><path d="M8 17v-3"/></symbol>
+        </svg>
+        
         <!-- Navigation -->
         <nav>
             <div class="nav-content">
                 <div class="logo">Concurrent OS</div>
                 <div class="nav-links">
                     <a href="#tests">Tests</a>
-                    <a href="http://localhost:9090" target="_blank">Prometheus</a>
-                    <a href="http://localhost:3000" target="_blank">Grafana</a>
-                    <a href="/docs" target="_blank">API Docs</a>
+                    <a href="http://localhost:9090" target="_blank" rel="noopener noreferrer">Prometheus</a>
+                    <a href="http://localhost:3000" target="_blank" rel="noopener noreferrer">Grafana</a>
+                    <a href="/docs" target="_blank" rel="noopener">API Docs</a>
                 </div>
             </div>
         </nav>
@@ -696,7 +673,7 @@ async def dashboard():
             <div class="grid">
                 <!-- Version A -->
                 <div class="card">
-                    <span class="card-icon">⚡</span>
+                    <svg class="card-icon" aria-hidden="true"><use href="#ico-bolt"/></svg>
                     <div class="card-subtitle">Version A</div>
                     <h2>Single Thread</h2>
                     <p class="card-description">
@@ -724,11 +701,11 @@ async def dashboard():
                 
                 <!-- Version B -->
                 <div class="card">
-                    <span class="card-icon">🚀</span>
+                    <svg class="card-icon" aria-hidden="true"><use href="#ico-rocket"/></svg>
                     <div class="card-subtitle">Version B</div>
                     <h2>Multi Thread</h2>
                     <p class="card-description">
-                        Parallel execution with mutex and semaphore synchronization. Maximum performance for CPU-bound tasks.
+                        Parallel execution on a bounded thread pool with striped mutex synchronization. Maximum performance for CPU-bound tasks.
                     </p>
                     <ul class="specs">
                         <li>
@@ -737,7 +714,7 @@ async def dashboard():
                         </li>
                         <li>
                             <span class="spec-label">Sync</span>
-                            <span class="spec-value">Mutex + Semaphore</span>
+                            <span class="spec-value">Striped Mutex + Pool</span>
                         </li>
                         <li>
                             <span class="spec-label">Throughput</span>
@@ -752,7 +729,7 @@ async def dashboard():
                 
                 <!-- Async -->
                 <div class="card">
-                    <span class="card-icon">⚙️</span>
+                    <svg class="card-icon" aria-hidden="true"><use href="#ico-gear"/></svg>
                     <div class="card-subtitle">Async Version</div>
                     <h2>Event Loop</h2>
                     <p class="card-description">
@@ -780,7 +757,7 @@ async def dashboard():
                 
                 <!-- System Info -->
                 <div class="card">
-                    <span class="card-icon">📊</span>
+                    <svg class="card-icon" aria-hidden="true"><use href="#ico-chart"/></svg>
                     <div class="card-subtitle">Monitoring</div>
                     <h2>System Metrics</h2>
                     <p class="card-description">
@@ -806,6 +783,13 @@ async def dashboard():
                     <div id="result-info" class="result-box"></div>
                 </div>
             </div>
+            
+            <!-- Jalankan keempat test sekaligus -->
+            <div class="run-all">
+                <button id="run-all" class="btn btn-secondary" onclick="runAll()">
+                    Run All Tests
+                </button>
+            </div>
         </div>
         
         <!-- Footer -->
@@ -814,76 +798,81 @@ async def dashboard():
             <p>© 2025-2026 Academic Year</p>
         </footer>
         
-        <script>
-            async function runTest(type, resultId) {
-                const resultBox = document.getElementById(resultId);
-                resultBox.innerHTML = `
-                    <div style="text-align: center; padding: 20px;">
-                        <div class="loading-spinner"></div>
-                        <p style="margin-top: 12px; color: #86868b; font-size: 14px;">Processing request...</p>
-                    </div>
-                `;
-                resultBox.classList.add('show');
-                
-                try {
-                    const response = await fetch(`/api/v1/process-${type}?items=10`);
-                    const data = await response.json();
-                    
-                    let html = `<div class="result-title">Test Results</div>`;
-                    html += `<div class="metric-row"><span class="metric-label">Version</span><span class="metric-value">${data.version}</span></div>`;
-                    html += `<div class="metric-row"><span class="metric-label">Items Processed</span><span class="metric-value">${data.items_processed}</span></div>`;
-                    html += `<div class="metric-row"><span class="metric-label">Duration</span><span class="metric-value">${data.duration_seconds}s</span></div>`;
-                    html += `<div class="metric-row"><span class="metric-label">Concurrency</span><span class="metric-value">${data.concurrency}</span></div>`;
-                    
-                    if (data.shared_counter !== undefined) {
-                        html += `<div class="metric-row"><span class="metric-label">Shared Counter</span><span class="metric-value">${data.shared_counter}</span></div>`;
-                    }
-                    
-                    resultBox.innerHTML = html;
-                } catch (error) {
-                    resultBox.innerHTML = `
-                        <div class="result-title">Error</div>
-                        <p style="color: #ff3b30; font-size: 14px;">${error.message}</p>
-                    `;
-                }
-            }
-            
-            async function getSystemInfo() {
-                const resultBox = document.getElementById('result-info');
-                resultBox.innerHTML = `
-                    <div style="text-align: center; padding: 20px;">
-                        <div class="loading-spinner"></div>
-                        <p style="margin-top: 12px; color: #86868b; font-size: 14px;">Fetching metrics...</p>
-                    </div>
-                `;
-                resultBox.classList.add('show');
-                
-                try {
-                    const response = await fetch('/api/v1/system-info');
-                    const data = await response.json();
-                    
-                    let html = `<div class="result-title">System Metrics</div>`;
-                    html += `<div class="metric-row"><span class="metric-label">CPU Cores</span><span class="metric-value">${data.cpu_count}</span></div>`;
-                    html += `<div class="metric-row"><span class="metric-label">CPU Usage</span><span class="metric-value">${data.cpu_percent}%</span></div>`;
-                    html += `<div class="metric-row"><span class="metric-label">Memory Usage</span><span class="metric-value">${data.memory_percent.toFixed(2)}%</span></div>`;
-                    html += `<div class="metric-row"><span class="metric-label">Active Threads</span><span class="metric-value">${data.active_threads}</span></div>`;
-                    html += `<div class="metric-row"><span class="metric-label">Shared Counter</span><span class="metric-value">${data.shared_counter}</span></div>`;
-                    html += `<div class="metric-row"><span class="metric-label">Store Items</span><span class="metric-value">${data.store_stats.total_items}</span></div>`;
-                    
-                    resultBox.innerHTML = html;
-                } catch (error) {
-                    resultBox.innerHTML = `
-                        <div class="result-title">Error</div>
-                        <p style="color: #ff3b30; font-size: 14px;">${error.message}</p>
-                    `;
-                }
-            }
-        </script>
+        <!-- Result templates (di-clone oleh dashboard.js) -->
+        <template id="loading-tmpl">
+            <div style="text-align: center; padding: 20px;">
+                <div class="loading-spinner"></div>
+                <p style="margin-top: 12px; color: #86868b; font-size: 14px;" data-field="message"></p>
+            </div>
+        </template>
+        <template id="result-tmpl">
+            <div class="result-title" data-field="title"></div>
+        </template>
+        <template id="row-tmpl">
+            <div class="metric-row"><span class="metric-label"></span><span class="metric-value"></span></div>
+        </template>
+        <template id="error-tmpl">
+            <div class="result-title">Error</div>
+            <p style="color: #ff3b30; font-size: 14px;" data-field="message"></p>
+        </template>
     </body>
     </html>
     """
+_CSS_URL = _STATIC_ASSETS["dashboard.css"].url
+_JS_URL = _STATIC_ASSETS["dashboard.js"].url
+_DASHBOARD_BYTES: bytes = _minify_html(_DASHBOARD_HTML.format(
+    css_url=_CSS_URL,
+    js_url=_JS_URL
+)).encode("utf-8")
+# Dashboard disajikan di URL ber-hash (immutable); "/" hanya redirect kecil ke sana
+_DASHBOARD_BUILD = hashlib.sha1(_DASHBOARD_BYTES).hexdigest()[:12]
+_DASHBOARD_URL = f"/_dash/{_DASHBOARD_BUILD}"
+# Dikompres sekali saat import, request hanya memilih response yang cocok.
+# Response object dibuat sekali dan dipakai ulang (lihat EncodedResponses.select
+# soal GZipMiddleware)
+_DASHBOARD = _encode_responses(_DASHBOARD_BYTES, "text/html", {
+    "cache-control": _IMMUTABLE_CACHE,
+    # Pengganti 103 Early Hints (belum didukung uvicorn): browser/proxy bisa mulai
+    # preload asset dan preconnect sebelum body HTML selesai di-parse
+    "link": (
+        f"<{_CSS_URL}>; rel=preload; as=style, "
+        f"<{_JS_URL}>; rel=preload; as=script, "
+        "<http://localhost:9090>; rel=preconnect, "
+        "<http://localhost:3000>; rel=preconnect"
+    )
+})
+# Redirect tidak boleh di-cache lama supaya deploy baru langsung terlihat
+_DASHBOARD_REDIRECT = RedirectResponse(
+    _DASHBOARD_URL, status_code=302, headers={"cache-control": "no-cache"}
+)
 
-@app.get("/health")
-async def health_check():
+async def dashboard_redirect(request: Request) -> Response:
+    """Redirect stub pointing at the current dashboard build"""
+    return _DASHBOARD_REDIRECT
+
+# Tetap async def: handler tidak pernah blocking, sedangkan plain def
+# akan dikirim ke threadpool (lebih mahal dari satu coroutine)
+async def dashboard(request: Request) -> Response:
+    """Apple-inspired minimalist dashboard"""
+    # Build lama (sebelum deploy terakhir) diarahkan ke build saat ini
+    if request.path_params["build"] != _DASHBOARD_BUILD:
+        return _DASHBOARD_REDIRECT
+    
+    # 304 kalau browser sudah punya versi yang sama, selain itu encoding terbaik
+    return _DASHBOARD.select(request)
+
+# Payload konstan, diserialisasi sekali; di bawah minimum_size GZipMiddleware,
+# jadi object ini tidak pernah diubah middleware
+_HEALTH_BYTES = b'{"status":"healthy","service":"concurrent-web-api"}'
+_HEALTH_RESPONSE = Response(_HEALTH_BYTES, media_type="application/json")
+
+async def health_check(request: Request) -> Response:
     """Health check endpoint"""
-    return {"status": "healthy", "service": "concurrent-web-api"}
\ No newline at end of file
+    return _HEALTH_RESPONSE
+
+# Endpoint konstan didaftarkan sebagai Starlette Route biasa, tanpa
+# dependency resolution dan response serialization dari FastAPI
+app.add_route("/", dashboard_redirect, methods=["GET"], include_in_schema=False)
+app.add_route("/_dash/{build}", dashboard, methods=["GET"], include_in_schema=False)
+app.add_route("/static/{name}", static_asset, methods=["GET"], include_in_schema=False)
+app.add_route("/health", health_check, methods=["GET"], include_in_schema=False)
\ No newline at end of file
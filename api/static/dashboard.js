@@ -0,0 +1,117 @@
+// Satu request aktif per result box; tombolnya dinonaktifkan selama fetch berjalan
+const inFlight = new Map();
+
+function startRequest(resultBox) {
+    inFlight.get(resultBox.id)?.abort();
+    const controller = new AbortController();
+    inFlight.set(resultBox.id, controller);
+    resultBox.parentElement.querySelector('.btn').disabled = true;
+    return controller;
+}
+
+function finishRequest(resultBox, controller) {
+    if (inFlight.get(resultBox.id) !== controller) {
+        return;  // Sudah digantikan request yang lebih baru
+    }
+    inFlight.delete(resultBox.id);
+    resultBox.parentElement.querySelector('.btn').disabled = false;
+}
+
+function cloneTemplate(id) {
+    return document.getElementById(id).content.cloneNode(true);
+}
+
+function showLoading(resultBox, message) {
+    const frag = cloneTemplate('loading-tmpl');
+    frag.querySelector('[data-field=message]').textContent = message;
+    resultBox.replaceChildren(frag);
+    resultBox.classList.add('show');
+}
+
+function showRows(resultBox, title, rows) {
+    const frag = cloneTemplate('result-tmpl');
+    frag.querySelector('[data-field=title]').textContent = title;
+    for (const [label, value] of rows) {
+        const row = cloneTemplate('row-tmpl');
+        row.querySelector('.metric-label').textContent = label;
+        row.querySelector('.metric-value').textContent = value;
+        frag.appendChild(row);
+    }
+    resultBox.replaceChildren(frag);
+}
+
+function showError(resultBox, message) {
+    const frag = cloneTemplate('error-tmpl');
+    frag.querySelector('[data-field=message]').textContent = message;
+    resultBox.replaceChildren(frag);
+}
+
+// Field map: [label, key, fmt]; field dengan nilai undefined dilewati
+const TEST_FIELDS = [
+    ['Version', 'version'],
+    ['Items Processed', 'items_processed'],
+    ['Duration', 'duration_seconds', v => `${v}s`],
+    ['Concurrency', 'concurrency'],
+    ['Shared Counter', 'shared_counter']
+];
+
+const SYSTEM_FIELDS = [
+    ['CPU Cores', 'cpu_count'],
+    ['CPU Usage', 'cpu_percent', v => `${v}%`],
+    ['Memory Usage', 'memory_percent', v => `${v.toFixed(2)}%`],
+    ['Active Threads', 'active_threads'],
+    ['Shared Counter', 'shared_counter'],
+    ['Store Items', 'store_stats', v => v.total_items]
+];
+
+async function renderMetrics(resultId, url, title, loadingMessage, fields) {
+    const resultBox = document.getElementById(resultId);
+    const controller = startRequest(resultBox);
+    showLoading(resultBox, loadingMessage);
+
+    try {
+        const response = await fetch(url, { signal: controller.signal });
+        const data = await response.json();
+
+        const rows = [];
+        for (const [label, key, fmt] of fields) {
+            const value = data[key];
+            if (value === undefined) continue;
+            rows.push([label, fmt ? fmt(value) : value]);
+        }
+
+        showRows(resultBox, title, rows);
+    } catch (error) {
+        if (error.name !== 'AbortError') {
+            showError(resultBox, error.message);
+        }
+    } finally {
+        finishRequest(resultBox, controller);
+    }
+}
+
+function runTest(type, resultId) {
+    return renderMetrics(resultId, `/api/v1/process-${type}?items=10`,
+        'Test Results', 'Processing request...', TEST_FIELDS);
+}
+
+function getSystemInfo() {
+    return renderMetrics('result-info', '/api/v1/system-info',
+        'System Metrics', 'Fetching metrics...', SYSTEM_FIELDS);
+}
+
+// Keempat fetch berjalan bersamaan: waktu total = latensi terlama, bukan jumlahnya
+async function runAll() {
+    const button = document.getElementById('run-all');
+    button.disabled = true;
+    try {
+        await Promise.all([
+            runTest('single', 'result-a'),
+            runTest('parallel', 'result-b'),
+            runTest('async', 'result-async'),
+            getSystemInfo()
+        ]);
+    } finally {
+        button.disabled = false;
+    }
+}